@@ -4,6 +4,12 @@ This module defines a custom reasoning and action agent graph.
 It invokes tools in a simple loop.
 """
 
-from src.agents.code_agent.graph import agent
-
 __all__ = ["agent"]
+
+
+def __getattr__(name: str):
+    # Resolved lazily so importing the package (e.g. for its tools) does not build the agent
+    if name == "agent":
+        from src.agents.code_agent.graph import get_agent
+        return get_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
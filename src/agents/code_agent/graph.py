@@ -1,21 +1,45 @@
 """Define a React agent.
+
+The agent is built on first access to ``agent`` (or ``get_agent()``), so importing
+this package does not pay for LangChain, provider registration or model setup.
 """
-from langchain.agents import create_agent
-from langchain_dev_utils.chat_models import load_chat_model
+import functools
 
 from src.agents.code_agent.prompts import SYSTEM_PROMPT
-from src.agents.code_agent.tools import FILE_TOOLS, BASH_TOOLS
 from src.agents.code_agent.context import Context
 
 
-model = load_chat_model("mm:MiniMax-M2")
+@functools.cache
+def get_agent():
+    """Build the code agent."""
+    from langchain.agents import create_agent
+    from langchain_dev_utils.chat_models import load_chat_model
+
+    from src.agents.common.http import ASYNC_CLIENT
+    from src.agents.common.llm_cache import CachingChatModel, LLMCache
+    from src.agents.common.providers import register_providers
+    from src.agents.code_agent.tools import FILE_TOOLS, BASH_TOOLS
+
+    register_providers()
+
+    model = CachingChatModel(
+        load_chat_model("mm:MiniMax-M2", http_async_client=ASYNC_CLIENT),
+        LLMCache(ttl_seconds=3600),
+    )
+
+    return create_agent(
+        model=model,
+        # Sorted so the serialized tool schemas form a byte-stable prompt prefix
+        tools=sorted(FILE_TOOLS + BASH_TOOLS, key=lambda tool: tool.__name__),
+        context_schema=Context,
+        system_prompt=SYSTEM_PROMPT
+    )
+
 
-agent = create_agent(
-    model=model,
-    tools=FILE_TOOLS + BASH_TOOLS,
-    context_schema=Context,
-    system_prompt=SYSTEM_PROMPT
-)
+def __getattr__(name: str):
+    if name == "agent":
+        return get_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
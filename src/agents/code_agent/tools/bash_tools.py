@@ -6,16 +6,123 @@ These tools are intended as free examples to get started. For production use,
 consider implementing more robust and specialized tools tailored to your needs.
 """
 
+import asyncio
 import os
-import subprocess
+import re
 import shlex
-from typing import Any, Callable, List
+import shutil
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from langchain.tools import ToolRuntime
 
+from src.agents.common.tool_cache import invalidates, memoize_tool
 from src.agents.code_agent.context import Context
 
 
-def execute_command(command: str, runtime: ToolRuntime[Context]) -> str:
+# Anything the shell has to interpret (pipes, redirection, globbing, variables,
+# builtins chained with && ...) keeps going through /bin/sh.
+_SHELL_SYNTAX = re.compile(r"[|&;<>()$`\\*?\[\]{}~!#\n]|^\s*\w+=")
+
+
+async def _spawn(command: str, cwd: Optional[str] = None, stdin: Optional[int] = None) -> asyncio.subprocess.Process:
+    """Start a command, exec'ing it directly when it needs no shell features."""
+    streams = dict(stdin=stdin, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE, cwd=cwd)
+    if not _SHELL_SYNTAX.search(command):
+        try:
+            argv = shlex.split(command)
+        except ValueError:
+            argv = []
+        if argv:
+            try:
+                return await asyncio.create_subprocess_exec(*argv, **streams)
+            except FileNotFoundError:
+                # Shell builtins (cd, export, ...) and unknown commands: let sh report them.
+                pass
+    return await asyncio.create_subprocess_shell(command, **streams)
+
+
+async def _run(command: str, timeout: float, cwd: Optional[str] = None, input: Optional[bytes] = None) -> Tuple[str, str, int]:
+    """Run a command and return its decoded stdout, stderr and exit code.
+
+    Raises:
+        asyncio.TimeoutError: If the command does not finish within ``timeout`` seconds
+    """
+    process = await _spawn(command, cwd, asyncio.subprocess.PIPE if input is not None else None)
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(input), timeout)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        raise
+    return stdout.decode("utf-8", errors="replace"), stderr.decode("utf-8", errors="replace"), process.returncode
+
+
+# Lines worth surfacing from a long log: compiler/linker diagnostics, Python
+# tracebacks and exceptions, test failures, panics and crashes.
+_ERROR_LINE = re.compile(
+    r"^.*(?:(?i:\berror\b)[:\[]|\bfatal:|Traceback \(most recent call last\):"
+    r"|\b\w+(?:Error|Exception)\b|\bFAILED\b|panicked at|Segmentation fault).*$",
+    re.MULTILINE,
+)
+_MAX_STREAM_CHARS = 8000
+_MAX_ERROR_LINES = 50
+
+
+def _condense(text: str, limit: int = _MAX_STREAM_CHARS) -> str:
+    """Shorten a long output stream before it is handed to the model.
+
+    The head and tail are kept verbatim; the dropped middle is replaced by the
+    error lines found in it, so a failure buried in a long build or test log
+    still reaches the model without paying for the whole log.
+    """
+    if len(text) <= limit:
+        return text
+    head_end = text.rfind("\n", 0, limit // 2) + 1 or limit // 2
+    tail_start = text.find("\n", len(text) - limit // 2) + 1 or len(text) - limit // 2
+    errors = list(dict.fromkeys(
+        match.group().strip() for match in _ERROR_LINE.finditer(text, head_end, tail_start)
+    ))
+    summary = f"\n... {tail_start - head_end} characters omitted ...\n"
+    if errors:
+        summary += "ERRORS:\n" + "".join(f"- {line}\n" for line in errors[:_MAX_ERROR_LINES])
+        if len(errors) > _MAX_ERROR_LINES:
+            summary += f"- ... {len(errors) - _MAX_ERROR_LINES} more\n"
+    return text[:head_end] + summary + text[tail_start:]
+
+
+# The environment as seen by the tools: captured once at import and kept in sync by
+# set_environment_variable, so every call (and concurrent agent runs) reads one stable view.
+_ENV_SNAPSHOT: Dict[str, str] = dict(os.environ)
+
+
+def _user_and_home() -> Tuple[Optional[str], Optional[str]]:
+    """Read the username and home directory from the environment snapshot."""
+    username = _ENV_SNAPSHOT.get("USER") or _ENV_SNAPSHOT.get("USERNAME")
+    home_dir = _ENV_SNAPSHOT.get("HOME") or _ENV_SNAPSHOT.get("USERPROFILE")
+    return username, home_dir
+
+
+_USER, _HOME = _user_and_home()
+
+
+# Successful lookups keyed by (command, PATH). Misses are not cached, so a
+# command installed later in the session is found on the next check.
+_WHICH_HITS: Dict[Tuple[str, Optional[str]], str] = {}
+
+
+def _which(command_name: str, search_path: Optional[str]) -> Optional[str]:
+    """Resolve a command on a PATH value; the PATH is part of the cache key."""
+    key = (command_name, search_path)
+    path = _WHICH_HITS.get(key)
+    if path is None:
+        path = shutil.which(command_name, path=search_path)
+        if path is not None:
+            _WHICH_HITS[key] = path
+    return path
+
+
+# Commands can install programs (npm, pip, ...), which check_command_exists caches under "env"
+@invalidates("fs", "env")
+async def execute_command(command: str, runtime: ToolRuntime[Context]) -> str:
     """Execute a bash command and return the output.
     
     Args:
@@ -26,35 +133,29 @@ def execute_command(command: str, runtime: ToolRuntime[Context]) -> str:
         The output of the command, including stdout and stderr
     """
     try:
-        # Use shell=True to allow shell features like pipes and redirection
-        result = subprocess.run(
-            command,
-            shell=True,
-            capture_output=True,
-            text=True,
-            timeout=30  # Add timeout to prevent hanging
-        )
+        stdout, stderr, returncode = await _run(command, timeout=30)  # Add timeout to prevent hanging
         
         output = ""
-        if result.stdout:
-            output += f"STDOUT:\n{result.stdout}"
-        if result.stderr:
-            output += f"\nSTDERR:\n{result.stderr}"
+        if stdout:
+            output += f"STDOUT:\n{_condense(stdout)}"
+        if stderr:
+            output += f"\nSTDERR:\n{_condense(stderr)}"
             
         if not output:
             output = "Command executed successfully with no output"
             
         # Add exit code information
-        output += f"\n\nExit code: {result.returncode}"
+        output += f"\n\nExit code: {returncode}"
         
         return output
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
         return f"Command timed out after 30 seconds: {command}"
     except Exception as e:
         return f"Error executing command: {str(e)}"
 
 
-def execute_command_with_cwd(command: str, working_dir: str, runtime: ToolRuntime[Context]) -> str:
+@invalidates("fs", "env")
+async def execute_command_with_cwd(command: str, working_dir: str, runtime: ToolRuntime[Context]) -> str:
     """Execute a bash command in a specific working directory.
     
     Args:
@@ -72,36 +173,29 @@ def execute_command_with_cwd(command: str, working_dir: str, runtime: ToolRuntim
         if not os.path.isdir(working_dir):
             return f"'{working_dir}' is not a directory"
         
-        # Use shell=True to allow shell features like pipes and redirection
-        result = subprocess.run(
-            command,
-            shell=True,
-            capture_output=True,
-            text=True,
-            cwd=working_dir,
-            timeout=30  # Add timeout to prevent hanging
-        )
+        stdout, stderr, returncode = await _run(command, timeout=30, cwd=working_dir)  # Add timeout to prevent hanging
         
         output = f"Command executed in directory: {working_dir}\n\n"
-        if result.stdout:
-            output += f"STDOUT:\n{result.stdout}"
-        if result.stderr:
-            output += f"\nSTDERR:\n{result.stderr}"
+        if stdout:
+            output += f"STDOUT:\n{_condense(stdout)}"
+        if stderr:
+            output += f"\nSTDERR:\n{_condense(stderr)}"
             
-        if not result.stdout and not result.stderr:
+        if not stdout and not stderr:
             output += "Command executed successfully with no output"
             
         # Add exit code information
-        output += f"\n\nExit code: {result.returncode}"
+        output += f"\n\nExit code: {returncode}"
         
         return output
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
         return f"Command timed out after 30 seconds: {command}"
     except Exception as e:
         return f"Error executing command: {str(e)}"
 
 
-def execute_interactive_command(command: str, runtime: ToolRuntime[Context]) -> str:
+@invalidates("fs", "env")
+async def execute_interactive_command(command: str, runtime: ToolRuntime[Context]) -> str:
     """Execute an interactive command (like vim, nano, etc.).
     
     Note: This function is limited in what it can do with truly interactive commands.
@@ -117,38 +211,29 @@ def execute_interactive_command(command: str, runtime: ToolRuntime[Context]) ->
     try:
         # For interactive commands, we need to use a different approach
         # This is a simplified implementation that may not work for all interactive commands
-        process = subprocess.Popen(
-            command,
-            shell=True,
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
-        
         # Send an empty input to handle simple prompts
-        stdout, stderr = process.communicate(input="", timeout=10)
+        stdout, stderr, returncode = await _run(command, timeout=10, input=b"")
         
         output = ""
         if stdout:
-            output += f"STDOUT:\n{stdout}"
+            output += f"STDOUT:\n{_condense(stdout)}"
         if stderr:
-            output += f"\nSTDERR:\n{stderr}"
+            output += f"\nSTDERR:\n{_condense(stderr)}"
             
         if not output:
             output = "Command executed with no output"
             
         # Add exit code information
-        output += f"\n\nExit code: {process.returncode}"
+        output += f"\n\nExit code: {returncode}"
         
         return output
-    except subprocess.TimeoutExpired:
-        process.kill()
+    except asyncio.TimeoutError:
         return f"Interactive command timed out after 10 seconds: {command}"
     except Exception as e:
         return f"Error executing interactive command: {str(e)}"
 
 
+@memoize_tool("env")
 def check_command_exists(command: str, runtime: ToolRuntime[Context]) -> str:
     """Check if a command exists on the system.
     
@@ -166,22 +251,18 @@ def check_command_exists(command: str, runtime: ToolRuntime[Context]) -> str:
         if not command_name:
             return "No command provided"
         
-        # Use 'which' command to check if command exists
-        result = subprocess.run(
-            f"which {command_name}",
-            shell=True,
-            capture_output=True,
-            text=True
-        )
+        # Look the command up in-process instead of forking `which`
+        path = _which(command_name, _ENV_SNAPSHOT.get("PATH"))
         
-        if result.returncode == 0:
-            return f"Command '{command_name}' exists at: {result.stdout.strip()}"
+        if path is not None:
+            return f"Command '{command_name}' exists at: {path}"
         else:
             return f"Command '{command_name}' not found in PATH"
     except Exception as e:
         return f"Error checking command: {str(e)}"
 
 
+@memoize_tool("env")
 def get_environment_variable(var_name: str, runtime: ToolRuntime[Context]) -> str:
     """Get the value of an environment variable.
     
@@ -193,7 +274,7 @@ def get_environment_variable(var_name: str, runtime: ToolRuntime[Context]) -> st
         The value of the environment variable or an error message
     """
     try:
-        value = os.environ.get(var_name)
+        value = _ENV_SNAPSHOT.get(var_name)
         if value is not None:
             return f"{var_name}={value}"
         else:
@@ -202,6 +283,7 @@ def get_environment_variable(var_name: str, runtime: ToolRuntime[Context]) -> st
         return f"Error getting environment variable: {str(e)}"
 
 
+@invalidates("env")
 def set_environment_variable(var_name: str, value: str, runtime: ToolRuntime[Context]) -> str:
     """Set an environment variable for the current process.
     
@@ -216,13 +298,17 @@ def set_environment_variable(var_name: str, value: str, runtime: ToolRuntime[Con
     Returns:
         Success message or error message
     """
+    global _USER, _HOME
     try:
         os.environ[var_name] = value
+        _ENV_SNAPSHOT[var_name] = value
+        _USER, _HOME = _user_and_home()
         return f"Successfully set {var_name}={value}"
     except Exception as e:
         return f"Error setting environment variable: {str(e)}"
 
 
+@memoize_tool("env")
 def list_environment_variables(runtime: ToolRuntime[Context]) -> str:
     """List all environment variables.
     
@@ -233,18 +319,17 @@ def list_environment_variables(runtime: ToolRuntime[Context]) -> str:
         A formatted string with all environment variables
     """
     try:
-        env_vars = os.environ
-        result = "Environment Variables:\n\n"
+        env_vars = _ENV_SNAPSHOT
         
         # Sort variables for consistent output
-        for var_name in sorted(env_vars.keys()):
-            result += f"{var_name}={env_vars[var_name]}\n"
+        lines = [f"{var_name}={env_vars[var_name]}\n" for var_name in sorted(env_vars.keys())]
             
-        return result
+        return "Environment Variables:\n\n" + "".join(lines)
     except Exception as e:
         return f"Error listing environment variables: {str(e)}"
 
 
+@memoize_tool("env", "cwd")
 def get_current_user(runtime: ToolRuntime[Context]) -> str:
     """Get information about the current user.
     
@@ -255,21 +340,16 @@ def get_current_user(runtime: ToolRuntime[Context]) -> str:
         User information
     """
     try:
-        # Get username
-        username = os.environ.get("USER") or os.environ.get("USERNAME")
-        
-        # Get home directory
-        home_dir = os.environ.get("HOME") or os.environ.get("USERPROFILE")
-        
-        # Get current working directory
+        # Username and home directory come from the snapshot; only the
+        # current working directory can change between calls
         cwd = os.getcwd()
         
-        result = f"Current User Information:\n\n"
-        result += f"Username: {username}\n"
-        result += f"Home Directory: {home_dir}\n"
-        result += f"Current Working Directory: {cwd}\n"
-        
-        return result
+        return (
+            f"Current User Information:\n\n"
+            f"Username: {_USER}\n"
+            f"Home Directory: {_HOME}\n"
+            f"Current Working Directory: {cwd}\n"
+        )
     except Exception as e:
         return f"Error getting user information: {str(e)}"
 
@@ -315,13 +395,13 @@ if __name__ == "__main__":
         
         # Test 3: execute_command
         print("3. Testing execute_command:")
-        result = execute_command("echo 'Hello from bash!'", mock_runtime)
+        result = asyncio.run(execute_command("echo 'Hello from bash!'", mock_runtime))
         print(f"   {result}")
         print()
         
         # Test 4: execute_command_with_cwd
         print("4. Testing execute_command_with_cwd:")
-        result = execute_command_with_cwd("pwd", "/tmp", mock_runtime)
+        result = asyncio.run(execute_command_with_cwd("pwd", "/tmp", mock_runtime))
         print(f"   {result}")
         print()
         
@@ -351,7 +431,7 @@ if __name__ == "__main__":
         
         # Test 8: execute_command with error
         print("8. Testing execute_command with error:")
-        result = execute_command("ls /nonexistent_directory", mock_runtime)
+        result = asyncio.run(execute_command("ls /nonexistent_directory", mock_runtime))
         print(f"   {result}")
         print()
         
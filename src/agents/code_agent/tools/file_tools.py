@@ -7,17 +7,38 @@ These tools are intended as free examples to get started. For production use,
 consider implementing more robust and specialized tools tailored to your needs.
 """
 
+import asyncio
+import fnmatch
 import os
+import re
 import shutil
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Callable, List
+from stat import S_ISDIR, S_ISREG
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+import aiofiles
 from langchain.tools import ToolRuntime
 
+from src.agents.common.tool_cache import invalidates, memoize_tool
 from src.agents.code_agent.context import Context
 # from context import Context
 
 
-def read_file(file_path: str, runtime: ToolRuntime[Context]) -> str:
+# Recently read file contents keyed by (absolute path, mtime_ns, size): any change
+# to the file produces a new key, so stale entries are never served.
+_READ_CACHE: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+_READ_CACHE_SIZE = 128
+
+
+def _forget_file(file_path: str) -> None:
+    """Drop cached contents of a file."""
+    path = os.path.abspath(file_path)
+    for key in [key for key in _READ_CACHE if key[0] == path]:
+        del _READ_CACHE[key]
+
+
+async def read_file(file_path: str, runtime: ToolRuntime[Context]) -> str:
     """Read the contents of a file.
     
     Args:
@@ -28,13 +49,26 @@ def read_file(file_path: str, runtime: ToolRuntime[Context]) -> str:
         The contents of the file as a string
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return f.read()
+        stat_result = os.stat(file_path)
+        key = (os.path.abspath(file_path), stat_result.st_mtime_ns, stat_result.st_size)
+        content = _READ_CACHE.get(key)
+        if content is not None:
+            _READ_CACHE.move_to_end(key)
+            return content
+        
+        async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
+            content = await f.read()
+        
+        _READ_CACHE[key] = content
+        if len(_READ_CACHE) > _READ_CACHE_SIZE:
+            _READ_CACHE.popitem(last=False)
+        return content
     except Exception as e:
         return f"Error reading file: {str(e)}"
 
 
-def write_file(file_path: str, content: str, runtime: ToolRuntime[Context]) -> str:
+@invalidates("fs")
+async def write_file(file_path: str, content: str, runtime: ToolRuntime[Context]) -> str:
     """Write content to a file.
     
     Args:
@@ -49,13 +83,16 @@ def write_file(file_path: str, content: str, runtime: ToolRuntime[Context]) -> s
         # Create directory if it doesn't exist
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        async with aiofiles.open(file_path, 'w', encoding='utf-8') as f:
+            await f.write(content)
+        # A rewrite within the same mtime tick and with the same size would keep its key
+        _forget_file(file_path)
         return f"Successfully wrote to {file_path}"
     except Exception as e:
         return f"Error writing file: {str(e)}"
 
 
+@memoize_tool("fs", "cwd")
 def list_directory(dir_path: str, runtime: ToolRuntime[Context]) -> str:
     """List the contents of a directory.
     
@@ -73,7 +110,10 @@ def list_directory(dir_path: str, runtime: ToolRuntime[Context]) -> str:
         if not os.path.isdir(dir_path):
             return f"'{dir_path}' is not a directory"
             
-        items = os.listdir(dir_path)
+        # scandir reports entry types from the directory listing itself, so only
+        # files need a stat() call (for their size).
+        with os.scandir(dir_path) as entries:
+            items = list(entries)
         if not items:
             return f"Directory '{dir_path}' is empty"
             
@@ -82,24 +122,24 @@ def list_directory(dir_path: str, runtime: ToolRuntime[Context]) -> str:
         dirs = []
         
         for item in items:
-            item_path = os.path.join(dir_path, item)
-            if os.path.isdir(item_path):
-                dirs.append(f"[DIR] {item}")
+            if item.is_dir():
+                dirs.append(f"[DIR] {item.name}")
             else:
-                size = os.path.getsize(item_path)
-                files.append(f"[FILE] {item} ({size} bytes)")
+                size = item.stat().st_size
+                files.append(f"[FILE] {item.name} ({size} bytes)")
         
-        result = f"Contents of '{dir_path}':\n\n"
+        parts = [f"Contents of '{dir_path}':\n\n"]
         if dirs:
-            result += "Directories:\n" + "\n".join(dirs) + "\n\n"
+            parts.append("Directories:\n" + "\n".join(dirs) + "\n\n")
         if files:
-            result += "Files:\n" + "\n".join(files)
+            parts.append("Files:\n" + "\n".join(files))
             
-        return result
+        return "".join(parts)
     except Exception as e:
         return f"Error listing directory: {str(e)}"
 
 
+@invalidates("fs")
 def create_directory(dir_path: str, runtime: ToolRuntime[Context]) -> str:
     """Create a new directory.
     
@@ -117,6 +157,7 @@ def create_directory(dir_path: str, runtime: ToolRuntime[Context]) -> str:
         return f"Error creating directory: {str(e)}"
 
 
+@invalidates("fs")
 def delete_file_or_path(path: str, runtime: ToolRuntime[Context]) -> str:
     """Delete a file or directory.
     
@@ -141,7 +182,8 @@ def delete_file_or_path(path: str, runtime: ToolRuntime[Context]) -> str:
         return f"Error deleting path: {str(e)}"
 
 
-def copy_file_or_path(src: str, dst: str, runtime: ToolRuntime[Context]) -> str:
+@invalidates("fs")
+async def copy_file_or_path(src: str, dst: str, runtime: ToolRuntime[Context]) -> str:
     """Copy a file or directory from source to destination.
     
     Args:
@@ -156,16 +198,19 @@ def copy_file_or_path(src: str, dst: str, runtime: ToolRuntime[Context]) -> str:
         if not os.path.exists(src):
             return f"Source path '{src}' does not exist"
             
+        # shutil already copies file data in-kernel (os.sendfile on Linux);
+        # running it in a worker thread keeps large copies off the event loop.
         if os.path.isdir(src):
-            shutil.copytree(src, dst)
+            await asyncio.to_thread(shutil.copytree, src, dst)
             return f"Successfully copied directory from '{src}' to '{dst}'"
         else:
-            shutil.copy2(src, dst)
+            await asyncio.to_thread(shutil.copy2, src, dst)
             return f"Successfully copied file from '{src}' to '{dst}'"
     except Exception as e:
         return f"Error copying: {str(e)}"
 
 
+@invalidates("fs")
 def move_file_or_path(src: str, dst: str, runtime: ToolRuntime[Context]) -> str:
     """Move a file or directory from source to destination.
     
@@ -187,6 +232,7 @@ def move_file_or_path(src: str, dst: str, runtime: ToolRuntime[Context]) -> str:
         return f"Error moving: {str(e)}"
 
 
+@memoize_tool("fs", "cwd")
 def get_file_info(file_path: str, runtime: ToolRuntime[Context]) -> str:
     """Get detailed information about a file or directory.
     
@@ -198,20 +244,21 @@ def get_file_info(file_path: str, runtime: ToolRuntime[Context]) -> str:
         Formatted string with file information
     """
     try:
-        if not os.path.exists(file_path):
+        try:
+            stat = os.stat(file_path)
+        except (OSError, ValueError):
             return f"Path '{file_path}' does not exist"
             
-        stat = os.stat(file_path)
         path_obj = Path(file_path)
         
         info = f"Information for '{file_path}':\n\n"
-        info += f"Type: {'Directory' if os.path.isdir(file_path) else 'File'}\n"
+        info += f"Type: {'Directory' if S_ISDIR(stat.st_mode) else 'File'}\n"
         info += f"Size: {stat.st_size} bytes\n"
         info += f"Created: {stat.st_ctime}\n"
         info += f"Modified: {stat.st_mtime}\n"
         info += f"Accessed: {stat.st_atime}\n"
         
-        if os.path.isfile(file_path):
+        if S_ISREG(stat.st_mode):
             info += f"Extension: {path_obj.suffix}\n"
             info += f"Parent directory: {path_obj.parent}\n"
             
@@ -220,6 +267,54 @@ def get_file_info(file_path: str, runtime: ToolRuntime[Context]) -> str:
         return f"Error getting file info: {str(e)}"
 
 
+def _format_match(path: str, stat_result: Optional[os.stat_result]) -> str:
+    """Format one search result line."""
+    if stat_result is not None and S_ISREG(stat_result.st_mode):
+        return f"[FILE] {path} ({stat_result.st_size} bytes)\n"
+    return f"[DIR] {path}\n"
+
+
+def _scan_directory(dir_path: str, match_name: Callable[[str], Any]) -> Tuple[List[str], List[str]]:
+    """List one directory, returning its formatted matches and its subdirectories.
+    
+    Entry types come from the directory listing and ``DirEntry.stat()`` is
+    cached, so each match costs at most one stat call.
+    """
+    try:
+        with os.scandir(dir_path) as entries:
+            items = list(entries)
+    except OSError:
+        return [], []
+    
+    matches = []
+    subdirs = []
+    for item in items:
+        path = item.name if dir_path == "." else os.path.join(dir_path, item.name)
+        if match_name(item.name):
+            try:
+                stat_result = item.stat()
+            except OSError:
+                stat_result = None
+            matches.append(_format_match(path, stat_result))
+        # Like Path.rglob, do not descend into symlinked directories
+        if item.is_dir(follow_symlinks=False):
+            subdirs.append(path)
+    return matches, subdirs
+
+
+def _iter_matches(dir_path: str, pattern: str) -> Iterator[str]:
+    """Yield formatted search results under a directory, scanning each directory once."""
+    # Translate the glob once instead of going through fnmatch per entry
+    match_name = re.compile(fnmatch.translate(pattern)).match
+    
+    stack = [dir_path]
+    while stack:
+        matches, subdirs = _scan_directory(stack.pop(), match_name)
+        yield from matches
+        stack.extend(reversed(subdirs))
+
+
+@memoize_tool("fs", "cwd")
 def search_files(dir_path: str, pattern: str, runtime: ToolRuntime[Context]) -> str:
     """Search for files matching a pattern in a directory.
     
@@ -239,24 +334,27 @@ def search_files(dir_path: str, pattern: str, runtime: ToolRuntime[Context]) ->
             return f"'{dir_path}' is not a directory"
             
         path_obj = Path(dir_path)
-        matches = list(path_obj.rglob(pattern))
+        if os.sep in pattern or "**" in pattern:
+            # Patterns spanning directories keep pathlib's matching rules
+            matches = []
+            for match in path_obj.rglob(pattern):
+                try:
+                    match_stat = match.stat()
+                except OSError:
+                    match_stat = None
+                matches.append(_format_match(str(match), match_stat))
+        else:
+            matches = list(_iter_matches(str(path_obj), pattern))
         
         if not matches:
             return f"No files found matching pattern '{pattern}' in '{dir_path}'"
             
-        result = f"Files matching pattern '{pattern}' in '{dir_path}':\n\n"
-        for match in matches:
-            if match.is_file():
-                size = match.stat().st_size
-                result += f"[FILE] {match} ({size} bytes)\n"
-            else:
-                result += f"[DIR] {match}\n"
-                
-        return result
+        return f"Files matching pattern '{pattern}' in '{dir_path}':\n\n" + "".join(matches)
     except Exception as e:
         return f"Error searching files: {str(e)}"
 
 
+@memoize_tool("cwd")
 def get_current_working_directory(runtime: ToolRuntime[Context]) -> str:
     """Get the current working directory.
     
@@ -272,6 +370,7 @@ def get_current_working_directory(runtime: ToolRuntime[Context]) -> str:
         return f"Error getting current directory: {str(e)}"
 
 
+@invalidates("cwd")
 def change_working_directory(dir_path: str, runtime: ToolRuntime[Context]) -> str:
     """Change the current working directory.
     
@@ -336,13 +435,13 @@ if __name__ == "__main__":
         print("3. Testing write_file:")
         test_file = os.path.join(test_subdir, "test_file.txt")
         test_content = "Hello, World!\nThis is a test file."
-        result = write_file(test_file, test_content, mock_runtime)
+        result = asyncio.run(write_file(test_file, test_content, mock_runtime))
         print(f"   {result}")
         print()
         
         # Test 4: read_file
         print("4. Testing read_file:")
-        result = read_file(test_file, mock_runtime)
+        result = asyncio.run(read_file(test_file, mock_runtime))
         print(f"   File content:\n   {result}")
         print()
         
@@ -361,9 +460,9 @@ if __name__ == "__main__":
         # Test 7: create more files for testing
         print("7. Creating more test files:")
         test_file2 = os.path.join(test_subdir, "test_file2.py")
-        write_file(test_file2, "# Python test file\nprint('Hello')", mock_runtime)
+        asyncio.run(write_file(test_file2, "# Python test file\nprint('Hello')", mock_runtime))
         test_file3 = os.path.join(test_subdir, "README.md")
-        write_file(test_file3, "# Test README\nThis is a markdown file.", mock_runtime)
+        asyncio.run(write_file(test_file3, "# Test README\nThis is a markdown file.", mock_runtime))
         print("   Created test_file2.py and README.md")
         print()
         
@@ -380,7 +479,7 @@ if __name__ == "__main__":
         # Test 9: copy_file_or_path
         print("9. Testing copy_file_or_path:")
         copy_dest = os.path.join(test_dir, "copied_file.txt")
-        result = copy_file_or_path(test_file, copy_dest, mock_runtime)
+        result = asyncio.run(copy_file_or_path(test_file, copy_dest, mock_runtime))
         print(f"   {result}")
         print()
         
@@ -424,7 +523,7 @@ if __name__ == "__main__":
         
         # Test 16: Error handling tests
         print("16. Testing error handling:")
-        result = read_file("nonexistent_file.txt", mock_runtime)
+        result = asyncio.run(read_file("nonexistent_file.txt", mock_runtime))
         print(f"   Reading nonexistent file: {result}")
         
         result = list_directory("nonexistent_dir", mock_runtime)
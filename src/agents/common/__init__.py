@@ -0,0 +1 @@
+"""Building blocks shared by the paper and code agents."""
@@ -0,0 +1,14 @@
+"""Shared HTTP client for model providers.
+
+Both agents talk to the same provider endpoints, so they share one
+connection pool: TCP/TLS handshakes and HTTP/2 connections are reused across
+agents and requests instead of being set up per model instance.
+"""
+
+import httpx
+
+
+ASYNC_CLIENT = httpx.AsyncClient(
+    http2=True,
+    limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+)
@@ -0,0 +1,477 @@
+"""Response caching for chat models.
+
+The cache plugs into LangChain's ``BaseCache`` hook, so every ``invoke``,
+``ainvoke`` and ``stream`` of a cached model (including the tool-bound copies
+``create_agent`` makes) looks up the serialized messages + model parameters
+before calling the provider, and only hits the network on a miss.
+
+``SemanticLLMCache`` adds a second tier: when the exact key misses, the user
+turns are embedded and compared against earlier calls that share the same
+non-user messages, so a reworded request can reuse a stored response.
+
+Entries (and their embeddings) go to a SQLite file by default, so a cached
+response survives the process and is reused by the next run.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Protocol, Tuple
+
+import numpy as np
+import orjson
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.embeddings import Embeddings
+from langchain_core.language_models import BaseChatModel
+from langchain_core.load import dumps, loads
+
+
+# Stamped into the database file (PRAGMA user_version) to identify its layout.
+_SCHEMA_VERSION = 1
+
+# Distinct user texts whose embeddings are kept in memory per SemanticLLMCache.
+_EMBEDDING_MEMO_SIZE = 256
+
+# Unit vectors are stored as int8 scaled by this factor, so a dot product of two
+# quantized vectors divided by _QUANT_SCALE ** 2 approximates their cosine.
+_QUANT_SCALE = 127
+
+
+def _quantize(vector: np.ndarray) -> np.ndarray:
+    """Quantize a unit-length vector to int8.
+
+    Args:
+        vector: An L2-normalized embedding
+
+    Returns:
+        The vector scaled by 127 and rounded to int8
+    """
+    return np.round(np.asarray(vector, dtype=np.float32) * _QUANT_SCALE).astype(np.int8)
+
+
+class CacheBackend(Protocol):
+    """Storage for serialized cache entries and their embeddings."""
+
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        """Return ``(value, created_at)`` for ``key``, or None on a miss."""
+        ...
+
+    def set(self, key: str, value: str, created_at: float) -> None:
+        """Store ``value`` under ``key``."""
+        ...
+
+    def delete(self, key: str) -> None:
+        """Drop ``key`` and its embedding if present."""
+        ...
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        ...
+
+    def add_embedding(self, key: str, scope: str, vector: np.ndarray) -> None:
+        """Store the int8-quantized semantic-cache vector of ``key``."""
+        ...
+
+    def load_embeddings(self) -> List[Tuple[str, str, np.ndarray]]:
+        """Return every stored ``(key, scope, vector)``."""
+        ...
+
+
+class MemoryBackend:
+    """Process-local backend backed by a dict."""
+
+    def __init__(self) -> None:
+        self._data: dict[str, Tuple[str, float]] = {}
+        self._embeddings: dict[str, Tuple[str, np.ndarray]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        with self._lock:
+            return self._data.get(key)
+
+    def set(self, key: str, value: str, created_at: float) -> None:
+        with self._lock:
+            self._data[key] = (value, created_at)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+            self._embeddings.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._embeddings.clear()
+
+    def add_embedding(self, key: str, scope: str, vector: np.ndarray) -> None:
+        with self._lock:
+            self._embeddings[key] = (scope, vector)
+
+    def load_embeddings(self) -> List[Tuple[str, str, np.ndarray]]:
+        with self._lock:
+            return [(key, scope, vector) for key, (scope, vector) in self._embeddings.items()]
+
+
+class SQLiteBackend:
+    """Backend stored in a SQLite database file, shared across runs."""
+
+    def __init__(self, path: str) -> None:
+        # LangChain runs async lookups in a thread pool, so the connection is shared
+        # across threads and serialized with a lock.
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            # WAL lets a second process read while another writes; lookups read
+            # the memory-mapped file instead of issuing read() calls.
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(f"PRAGMA mmap_size={1 << 30}")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache "
+                "(key TEXT PRIMARY KEY, response BLOB NOT NULL, ts INTEGER NOT NULL, hits INTEGER NOT NULL DEFAULT 0)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings "
+                "(key TEXT PRIMARY KEY, scope TEXT NOT NULL, vec BLOB NOT NULL)"
+            )
+            self._conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        with self._lock:
+            row = self._conn.execute("SELECT response, ts FROM llm_cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            # Hit counting is bookkeeping only; a busy database must not turn a hit into an error.
+            try:
+                with self._conn:
+                    self._conn.execute("UPDATE llm_cache SET hits = hits + 1 WHERE key = ?", (key,))
+            except sqlite3.Error:
+                pass
+        return row[0].decode("utf-8"), row[1]
+
+    def set(self, key: str, value: str, created_at: float) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, response, ts) VALUES (?, ?, ?)",
+                (key, value.encode("utf-8"), int(created_at)),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+            self._conn.execute("DELETE FROM embeddings WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM llm_cache")
+            self._conn.execute("DELETE FROM embeddings")
+
+    def add_embedding(self, key: str, scope: str, vector: np.ndarray) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO embeddings (key, scope, vec) VALUES (?, ?, ?)",
+                (key, scope, np.ascontiguousarray(vector, dtype=np.int8).tobytes()),
+            )
+
+    def load_embeddings(self) -> List[Tuple[str, str, np.ndarray]]:
+        with self._lock:
+            rows = self._conn.execute("SELECT key, scope, vec FROM embeddings").fetchall()
+        return [(key, scope, np.frombuffer(vec, dtype=np.int8)) for key, scope, vec in rows]
+
+
+def default_backend() -> CacheBackend:
+    """Open the on-disk cache shared by every run.
+
+    The database lives at ``$LLM_CACHE_PATH``, or ``.cache/llm_cache.sqlite3``
+    under the working directory when the variable is unset.
+    """
+    path = os.environ.get("LLM_CACHE_PATH") or os.path.join(".cache", "llm_cache.sqlite3")
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    return SQLiteBackend(path)
+
+
+def cache_key(prompt: str, llm_string: str, temperature: Optional[float] = None) -> Optional[str]:
+    """Build the exact-match key for a model call.
+
+    langchain-core (from 1.3) strips the random message ids from ``prompt``, so
+    the same conversation yields the same key in every run.
+
+    Args:
+        prompt: The serialized message list
+        llm_string: The serialized model, its parameters and bound tools
+        temperature: The sampling temperature of the model, if known
+
+    Returns:
+        A sha256 hex digest, or None when the call samples (temperature > 0)
+        and must not be cached
+    """
+    if temperature is not None and temperature > 0:
+        return None
+    digest = hashlib.sha256(llm_string.encode("utf-8"))
+    digest.update(b"\x00")
+    digest.update(prompt.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class LLMCache(BaseCache):
+    """Exact-match cache for chat model generations."""
+
+    def __init__(self, backend: Optional[CacheBackend] = None, ttl_seconds: Optional[float] = None) -> None:
+        self.backend = backend if backend is not None else default_backend()
+        self.ttl_seconds = ttl_seconds
+        self.temperature: Optional[float] = None
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        key = cache_key(prompt, llm_string, self.temperature)
+        if key is None:
+            return None
+        return self._get(key)
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        key = cache_key(prompt, llm_string, self.temperature)
+        if key is None:
+            return
+        try:
+            self.backend.set(key, dumps(list(return_val)), time.time())
+        except sqlite3.Error:
+            # An unavailable cache only costs the next call a miss
+            pass
+
+    def clear(self, **kwargs: Any) -> None:
+        self.backend.clear()
+
+    def _get(self, key: str) -> Optional[RETURN_VAL_TYPE]:
+        try:
+            entry = self.backend.get(key)
+            if entry is None:
+                return None
+            value, created_at = entry
+            if self.ttl_seconds is not None and time.time() - created_at > self.ttl_seconds:
+                self.backend.delete(key)
+                return None
+        except sqlite3.Error:
+            # A locked or unreadable database is a miss, never a failed model call
+            return None
+        return loads(value, allowed_objects="core")
+
+
+class SemanticLLMCache(LLMCache):
+    """Exact-match cache with an embedding-similarity fallback.
+
+    Candidates are grouped by a scope hash of the model parameters and every
+    non-user message, so only the wording of the user turns may differ between
+    a lookup and the stored call it matches. The semantic tier only serves
+    models configured with ``temperature == 0``; without ``embeddings`` or for
+    any other temperature this behaves exactly like ``LLMCache``.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        embeddings: Optional[Embeddings] = None,
+        ttl_seconds: Optional[float] = None,
+        threshold: float = 0.92,
+    ) -> None:
+        super().__init__(backend, ttl_seconds)
+        self.embeddings = embeddings
+        self.threshold = threshold
+        # scope -> (exact keys, int8-quantized unit embedding rows). Quantizing
+        # keeps the index 4x smaller than float32 and the lookup an integer GEMV.
+        self._index: Dict[str, Tuple[List[str], np.ndarray]] = {}
+        # Query vectors computed on a miss, reused when the response is stored.
+        self._pending: Dict[str, np.ndarray] = {}
+        # text -> quantized embedding. Every step of an agent loop misses the exact
+        # tier with the same user text, which is embedded only once.
+        self._embedded: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._load_index()
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        key = cache_key(prompt, llm_string, self.temperature)
+        if key is None:
+            return None
+        hit = self._get(key)
+        if hit is not None or not self._semantic_enabled:
+            return hit
+        # The semantic tier is best-effort: any failure in it is just a miss.
+        try:
+            return self._semantic_lookup(key, prompt, llm_string)
+        except Exception:
+            return None
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        super().update(prompt, llm_string, return_val)
+        key = cache_key(prompt, llm_string, self.temperature)
+        if key is None or not self._semantic_enabled:
+            return
+        try:
+            self._semantic_update(key, prompt, llm_string)
+        except Exception:
+            pass
+
+    @property
+    def _semantic_enabled(self) -> bool:
+        # A near match is only a valid answer when the model would answer deterministically.
+        return self.embeddings is not None and self.temperature == 0
+
+    def _semantic_lookup(self, key: str, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        query = _semantic_query(prompt, llm_string)
+        if query is None:
+            return None
+        scope, text = query
+        vector = self._embed(text)
+        if vector is None:
+            return None
+
+        while True:
+            with self._lock:
+                keys, matrix = self._index.get(scope, ([], None))
+                match = None
+                if keys:
+                    scores = np.matmul(matrix, vector, dtype=np.int32) / _QUANT_SCALE ** 2
+                    best = int(np.argmax(scores))
+                    if scores[best] >= self.threshold:
+                        match = keys[best]
+                if match is None:
+                    self._pending[key] = vector
+                    return None
+            hit = self._get(match)
+            if hit is not None:
+                return hit
+            # The match expired (or vanished from the backend); drop it so the
+            # next-best candidate gets its turn.
+            self._forget(scope, match)
+
+    def _semantic_update(self, key: str, prompt: str, llm_string: str) -> None:
+        query = _semantic_query(prompt, llm_string)
+        if query is None:
+            return
+        scope, text = query
+        with self._lock:
+            vector = self._pending.pop(key, None)
+        if vector is None:
+            vector = self._embed(text)
+            if vector is None:
+                return
+
+        with self._lock:
+            keys, matrix = self._index.get(scope, ([], None))
+            if key in keys:
+                return
+            rows = vector[None, :] if matrix is None else np.vstack([matrix, vector])
+            self._index[scope] = (keys + [key], rows)
+        self.backend.add_embedding(key, scope, vector)
+
+    def _forget(self, scope: str, key: str) -> None:
+        """Remove ``key`` from the in-memory index of ``scope``."""
+        with self._lock:
+            self._pending.pop(key, None)
+            keys, matrix = self._index.get(scope, ([], None))
+            if key not in keys:
+                return
+            position = keys.index(key)
+            if len(keys) == 1:
+                del self._index[scope]
+            else:
+                self._index[scope] = (keys[:position] + keys[position + 1:], np.delete(matrix, position, axis=0))
+
+    def clear(self, **kwargs: Any) -> None:
+        super().clear(**kwargs)
+        with self._lock:
+            self._index.clear()
+            self._pending.clear()
+            self._embedded.clear()
+
+    def _load_index(self) -> None:
+        """Rebuild the in-memory index from the vectors stored by earlier runs."""
+        grouped: Dict[str, Tuple[List[str], List[np.ndarray]]] = {}
+        for key, scope, vector in self.backend.load_embeddings():
+            keys, vectors = grouped.setdefault(scope, ([], []))
+            keys.append(key)
+            vectors.append(vector)
+        for scope, (keys, vectors) in grouped.items():
+            self._index[scope] = (keys, np.vstack(vectors))
+
+    def _embed(self, text: str) -> Optional[np.ndarray]:
+        with self._lock:
+            vector = self._embedded.get(text)
+            if vector is not None:
+                self._embedded.move_to_end(text)
+                return vector
+        # A failing embedding call only costs the semantic tier, never the model call.
+        try:
+            embedding = np.asarray(self.embeddings.embed_query(text), dtype=np.float32)
+        except Exception:
+            return None
+        norm = float(np.linalg.norm(embedding))
+        if not norm:
+            return None
+        vector = _quantize(embedding / norm)
+        with self._lock:
+            self._embedded[text] = vector
+            if len(self._embedded) > _EMBEDDING_MEMO_SIZE:
+                self._embedded.popitem(last=False)
+        return vector
+
+
+def _message_text(content: Any) -> str:
+    """Join the text parts of a serialized message content (a string or a list of blocks)."""
+    if isinstance(content, str):
+        return content
+    parts = []
+    for block in content or []:
+        if isinstance(block, str):
+            parts.append(block)
+        elif isinstance(block, dict) and block.get("type") == "text":
+            parts.append(block.get("text", ""))
+    return "".join(parts)
+
+
+def _semantic_query(prompt: str, llm_string: str) -> Optional[Tuple[str, str]]:
+    """Split a serialized prompt into its semantic scope and user text.
+
+    The prompt is read as plain JSON; reviving it into message objects would
+    re-validate every stored message and could fail on fields LangChain itself
+    adds to cached responses.
+    """
+    messages = orjson.loads(prompt)
+    skeleton = []
+    texts = []
+    for message in messages:
+        kwargs = message.get("kwargs", {}) if isinstance(message, dict) else {}
+        message_id = message.get("id") if isinstance(message, dict) else None
+        is_human = kwargs.get("type") == "human" or (
+            isinstance(message_id, list) and message_id[-1:] in (["HumanMessage"], ["HumanMessageChunk"])
+        )
+        if is_human:
+            texts.append(_message_text(kwargs.get("content")))
+            message = {**message, "kwargs": {**kwargs, "content": ""}}
+        skeleton.append(message)
+    if not any(texts):
+        return None
+    digest = hashlib.sha256(llm_string.encode("utf-8"))
+    digest.update(b"\x00")
+    # orjson emits canonical (key-sorted) UTF-8 bytes that feed the hash directly.
+    digest.update(orjson.dumps(skeleton, option=orjson.OPT_SORT_KEYS))
+    return digest.hexdigest(), "\n".join(texts)
+
+
+def CachingChatModel(model: BaseChatModel, cache: LLMCache) -> BaseChatModel:
+    """Return a copy of ``model`` that answers repeated calls from ``cache``.
+
+    Args:
+        model: The chat model to wrap
+        cache: The cache to consult before each provider call
+
+    Returns:
+        The cached model
+    """
+    cache.temperature = getattr(model, "temperature", None)
+    return model.model_copy(update={"cache": cache})
@@ -0,0 +1,24 @@
+"""Register the chat model providers used by the agents."""
+
+_registered = False
+
+
+def register_providers() -> None:
+    """Register the OpenAI-compatible providers, once per process."""
+    global _registered
+    if _registered:
+        return
+
+    from langchain_dev_utils.chat_models import register_model_provider
+
+    register_model_provider(
+        provider_name="mm",
+        chat_model="openai-compatible",
+        base_url="https://api.minimaxi.com/v1",
+    )
+    register_model_provider(
+        provider_name="glm",
+        chat_model="openai-compatible",
+        base_url="https://open.bigmodel.cn/api/paas/v4",
+    )
+    _registered = True
@@ -0,0 +1,107 @@
+"""Helpers for consuming agent streams.
+
+Tokens are written to stdout in small time-batched flushes instead of one
+``print`` per chunk, and streamed chunks of the same reply are merged so the
+collected history holds one message per reply.
+"""
+
+import asyncio
+import sys
+from typing import Any, List, Optional
+
+from langchain_core.messages import AIMessageChunk, BaseMessage
+
+
+STREAM_MODES = ["messages", "updates", "custom"]
+
+
+def apply_event(history: List[BaseMessage], message: BaseMessage) -> List[BaseMessage]:
+    """Append a streamed message to the history, merging partial chunks.
+
+    Args:
+        history: The messages collected so far
+        message: The message or chunk emitted by the stream
+
+    Returns:
+        The updated history
+    """
+    if (
+        history
+        and isinstance(message, AIMessageChunk)
+        and isinstance(history[-1], AIMessageChunk)
+        and history[-1].id == message.id
+    ):
+        history[-1] = history[-1] + message
+    else:
+        history.append(message)
+    return history
+
+
+async def stream_agent(
+    agent: Any,
+    inputs: Any,
+    config: Optional[dict] = None,
+    flush_interval: float = 0.1,
+) -> List[BaseMessage]:
+    """Stream an agent run to stdout.
+
+    Args:
+        agent: The compiled agent graph
+        inputs: The input state for the run
+        config: Optional run config (e.g. recursion_limit)
+        flush_interval: Seconds to buffer tokens before writing them out
+
+    Returns:
+        The streamed messages, with partial chunks merged per reply
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    history: List[BaseMessage] = []
+
+    async def produce() -> None:
+        try:
+            async for item in agent.astream(inputs, config=config, stream_mode=STREAM_MODES):
+                await queue.put(item)
+        finally:
+            await queue.put(None)
+
+    producer = asyncio.create_task(produce())
+    loop = asyncio.get_running_loop()
+    buffer: List[str] = []
+    deadline = loop.time() + flush_interval
+
+    def flush() -> None:
+        nonlocal deadline
+        if buffer:
+            sys.stdout.write("".join(buffer))
+            buffer.clear()
+            sys.stdout.flush()
+        deadline = loop.time() + flush_interval
+
+    while True:
+        try:
+            item = await asyncio.wait_for(queue.get(), max(0.0, deadline - loop.time()))
+        except asyncio.TimeoutError:
+            flush()
+            continue
+        if item is None:
+            break
+
+        mode, chunk = item
+        if mode == "messages":
+            message, metadata = chunk
+            apply_event(history, message)
+            buffer.append(message.text)
+            # Tool results arrive whole; model replies end with a finish_reason.
+            if not isinstance(message, AIMessageChunk) or message.response_metadata.get("finish_reason"):
+                buffer.append("\n")
+                flush()
+        else:
+            buffer.append(f"{chunk}\n")
+            flush()
+
+        if loop.time() >= deadline:
+            flush()
+
+    flush()
+    await producer
+    return history
@@ -0,0 +1,122 @@
+"""Result caching for read-only agent tools.
+
+``memoize_tool`` caches a tool's output per argument set (the injected
+``runtime`` is ignored) under one or more tags describing the state it reads.
+``invalidates`` marks a state-changing tool: after every call it drops the
+cached results of all tools sharing one of its tags.
+
+Tags used by the tools:
+    fs: file system contents
+    cwd: the process working directory (relative paths resolve against it)
+    env: the process environment
+"""
+
+import functools
+import inspect
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_TOOLS_BY_TAG: Dict[str, List[Callable[..., Any]]] = {}
+_STATS: Dict[str, Dict[str, int]] = {}
+
+
+def memoize_tool(*tags: str, maxsize: int = 256) -> Callable[[F], F]:
+    """Cache the results of a read-only tool.
+
+    Args:
+        tags: The kinds of state the tool reads
+        maxsize: The number of argument sets to keep per tool
+
+    Returns:
+        A decorator; the wrapped tool gains a ``cache_clear()`` method
+    """
+    def decorator(func: F) -> F:
+        signature = inspect.signature(func)
+        cache: "OrderedDict[tuple, Any]" = OrderedDict()
+        lock = threading.Lock()
+        # Bumped by cache_clear; a miss computed across an invalidation is not stored
+        generation = 0
+        stats = _STATS.setdefault(f"{func.__module__}.{func.__qualname__}", {"hits": 0, "misses": 0})
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = tuple(item for item in bound.arguments.items() if item[0] != "runtime")
+            try:
+                with lock:
+                    started = generation
+                    if key in cache:
+                        cache.move_to_end(key)
+                        stats["hits"] += 1
+                        return cache[key]
+            except TypeError:
+                # Unhashable arguments are simply not cached
+                return func(*args, **kwargs)
+
+            result = func(*args, **kwargs)
+            with lock:
+                stats["misses"] += 1
+                if generation == started:
+                    cache[key] = result
+                    if len(cache) > maxsize:
+                        cache.popitem(last=False)
+            return result
+
+        def cache_clear() -> None:
+            nonlocal generation
+            with lock:
+                generation += 1
+                cache.clear()
+
+        wrapper.cache_clear = cache_clear
+        for tag in tags:
+            _TOOLS_BY_TAG.setdefault(tag, []).append(wrapper)
+        return wrapper
+
+    return decorator
+
+
+def invalidate(*tags: str) -> None:
+    """Drop the cached results of every tool registered under ``tags``."""
+    for tag in tags:
+        for tool in _TOOLS_BY_TAG.get(tag, ()):
+            tool.cache_clear()
+
+
+def invalidates(*tags: str) -> Callable[[F], F]:
+    """Mark a tool that changes the state described by ``tags``.
+
+    Works for both sync and async tools; the caches are dropped after the call
+    whether it succeeded or not, since a failed operation may have partially
+    applied.
+    """
+    def decorator(func: F) -> F:
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    invalidate(*tags)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return func(*args, **kwargs)
+            finally:
+                invalidate(*tags)
+
+        return wrapper
+
+    return decorator
+
+
+def cache_stats() -> Dict[str, Dict[str, int]]:
+    """Return hit/miss counters per memoized tool."""
+    return {name: dict(counts) for name, counts in _STATS.items()}
@@ -1,21 +1,54 @@
 """Define a React agent.
+
+The agent is built on first access to ``agent`` (or ``get_agent()``), so importing
+this package does not pay for LangChain, provider registration or model setup.
 """
-from langchain.agents import create_agent
-from langchain_dev_utils.chat_models import load_chat_model
+import functools
+import os
 
 from src.agents.paper_agent.prompts import SYSTEM_PROMPT
-from src.agents.paper_agent.tools import PAPER_TOOLS, FILE_TOOLS
 from src.agents.paper_agent.context import Context
 
 
-model = load_chat_model("minimax:MiniMax-M2")
-
-agent = create_agent(
-    model=model,
-    tools=PAPER_TOOLS+FILE_TOOLS,
-    context_schema=Context,
-    system_prompt=SYSTEM_PROMPT
-)
+@functools.cache
+def get_agent():
+    """Build the paper agent."""
+    from langchain.agents import create_agent
+    from langchain_dev_utils.chat_models import load_chat_model
+    from langchain_openai import OpenAIEmbeddings
+
+    from src.agents.common.http import ASYNC_CLIENT
+    from src.agents.common.llm_cache import CachingChatModel, SemanticLLMCache
+    from src.agents.common.providers import register_providers
+    from src.agents.paper_agent.tools import PAPER_TOOLS, FILE_TOOLS
+
+    register_providers()
+
+    # Reworded summary requests are answered from the cache when an embedding key is configured.
+    embeddings = (
+        OpenAIEmbeddings(model="text-embedding-3-small")
+        if os.environ.get("OPENAI_API_KEY")
+        else None
+    )
+
+    model = CachingChatModel(
+        load_chat_model("minimax:MiniMax-M2", http_async_client=ASYNC_CLIENT),
+        SemanticLLMCache(embeddings=embeddings, ttl_seconds=3600),
+    )
+
+    return create_agent(
+        model=model,
+        # Sorted so the serialized tool schemas form a byte-stable prompt prefix
+        tools=sorted(PAPER_TOOLS + FILE_TOOLS, key=lambda tool: tool.__name__),
+        context_schema=Context,
+        system_prompt=SYSTEM_PROMPT
+    )
+
+
+def __getattr__(name: str):
+    if name == "agent":
+        return get_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
@@ -1,4 +1,5 @@
 """Default prompts used by the agent."""
 
 SYSTEM_PROMPT = """You are a helpful AI Markdown Reading assistant.
+When several tool calls do not depend on each other (e.g. reading multiple files), request them together in one turn; they run concurrently.
 """
@@ -6,12 +6,235 @@ and reading content in pages or sections. These tools are designed to be flexibl
 for AI agents to process markdown documents efficiently.
 """
 
+import functools
+import io
 import os
-import re
-from typing import Any, Callable, List, Optional, Tuple
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate, islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
 from langchain.tools import ToolRuntime
 
 from src.agents.paper_agent.context import Context
+from src.agents.paper_agent.tools import _uring_backend
+
+
+# Characters other than \n (and \r, already translated) that str.splitlines breaks on;
+# a few `in` scans of a str are far cheaper than one regex search over it
+_OTHER_LINE_BREAKS = '\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029'
+
+# UTF-8 of the only non-ASCII characters whose str.lower() contains ASCII:
+# U+0130 (dotted capital I -> "i" + combining dot) and U+212A (Kelvin sign -> "k")
+_LOWERS_TO_ASCII = (b'\xc4\xb0', b'\xe2\x84\xaa')
+
+# Prefix of a context line in search results, indexed by "is this the matching line"
+_MARKERS = ("    ", ">>> ")
+
+
+def _parse_header(line: str) -> Optional[Tuple[int, str]]:
+    """Parse an ATX header ("# Title" ... "###### Title").
+
+    Equivalent to matching ``^(#{1,6})\\s+(.+)$``, but most lines are rejected
+    by their first character without running a regex.
+
+    Returns:
+        ``(level, name)``, or None when the line is not a header
+    """
+    if line[:1] != '#':
+        return None
+    level = len(line) - len(line.lstrip('#'))
+    # At least one whitespace character after the hashes, then at least one more character
+    if level > 6 or len(line) <= level + 1 or not line[level].isspace():
+        return None
+    return level, line[level:].strip()
+
+
+class ParsedDoc(NamedTuple):
+    """A markdown file read and split once, shared by the paper tools."""
+
+    lines: List[str]  # with line endings, as readlines() returns them
+    total_lines: int
+    sections: List[Dict[str, Any]]  # {'name', 'level', 'line'} of each header; see _section_text
+    content_lower: bytes  # the UTF-8 text with ASCII letters lowercased
+    line_offsets: array  # byte offset of each line in content_lower, then its length
+    ascii_search_exact: bool  # see _find_lines
+    section_names_lower: List[str]  # lowercased name of each section
+    section_index: Dict[str, int]  # lowercased name -> first section with that name
+
+
+def _iter_sections(lines: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """Yield ``{'name', 'level', 'line'}`` for each header in lines as readlines() returns them."""
+    for idx, line in enumerate(lines):
+        # Only lines starting with '#' pay for dropping the line ending
+        if line[:1] == '#':
+            header = _parse_header(line.rstrip('\n'))
+            if header:
+                level, name = header
+                yield {'name': name, 'level': level, 'line': idx + 1}
+
+
+def _section_text(doc: ParsedDoc, position: int) -> str:
+    """Return the text of a section: its header line up to the next header."""
+    start = doc.sections[position]['line'] - 1
+    if position + 1 < len(doc.sections):
+        end = doc.sections[position + 1]['line'] - 1
+    else:
+        end = None
+    text = "".join(doc.lines[start:end])
+    return text[:-1] if text.endswith('\n') else text
+
+
+@functools.lru_cache(maxsize=32)
+def _load(path: str, mtime_ns: int, size: int) -> ParsedDoc:
+    """Read and parse a file; the stat fields in the key invalidate stale entries."""
+    with open(path, 'r', encoding='utf-8') as f:
+        lines = f.readlines()
+    text = "".join(lines)
+    is_ascii = text.isascii()
+    if is_ascii:
+        # One byte per character: lowercase the text at once, lines keep their str lengths
+        content_lower = text.encode('ascii').lower()
+        line_lengths = map(len, lines)
+    else:
+        # bytes.lower() only folds ASCII, so every line keeps its encoded length
+        lower_lines = [line.encode('utf-8').lower() for line in lines]
+        content_lower = b"".join(lower_lines)
+        line_lengths = map(len, lower_lines)
+    # Numbered like read_markdown_lines and read_markdown_pages number them
+    sections = list(_iter_sections(lines))
+    names_lower = [info['name'].lower() for info in sections]
+    section_index: Dict[str, int] = {}
+    for i, name in enumerate(names_lower):
+        if name:
+            section_index.setdefault(name, i)
+    return ParsedDoc(
+        lines,
+        len(lines),
+        sections,
+        content_lower,
+        array('q', accumulate(line_lengths, initial=0)),
+        is_ascii or not any(char in content_lower for char in _LOWERS_TO_ASCII),
+        names_lower,
+        section_index,
+    )
+
+
+def _find_lines(doc: ParsedDoc, needle_lower: str) -> List[int]:
+    """Return the indices of the lines whose lowercased text contains ``needle_lower``.
+
+    For an ASCII needle, bytes.find jumps from hit to hit over the ASCII-lowercased
+    file; each hit is mapped to its line with a binary search, and the rest of that
+    line is skipped. ASCII bytes never occur inside a multi-byte UTF-8 sequence, so
+    this finds exactly what a full Unicode lower() would, unless the file contains
+    one of the few characters whose lowercase form is ASCII. Those files and
+    non-ASCII needles are searched line by line with str.lower().
+    """
+    if not (needle_lower.isascii() and doc.ascii_search_exact):
+        return [i for i, line in enumerate(doc.lines) if needle_lower in line.lower()]
+        
+    needle = needle_lower.encode('ascii')
+    content, offsets = doc.content_lower, doc.line_offsets
+    found = []
+    pos = content.find(needle)
+    while 0 <= pos < len(content):
+        idx = bisect_right(offsets, pos) - 1
+        line_end = offsets[idx + 1]
+        if pos + len(needle) <= line_end:
+            found.append(idx)
+            pos = content.find(needle, line_end)
+        else:
+            # The hit runs into the next line, which a per-line search would not see
+            pos = content.find(needle, pos + 1)
+    return found
+
+
+@functools.lru_cache(maxsize=32)
+def _line_offsets(path: str, mtime_ns: int, size: int) -> array:
+    """Byte offset of every line start in a file, followed by the file size.
+
+    Lines break where text-mode reading breaks them (\\n, \\r\\n or \\r), so
+    ``offsets[i]:offsets[j]`` holds exactly the lines i..j-1 of readlines().
+    """
+    offsets = array('q', [0])
+    carry = b""
+    # Built in chunks, so a first page request does not hold the whole file
+    with open(path, 'rb') as f:
+        while chunk := f.read(1 << 20):
+            pieces = (carry + chunk).splitlines(keepends=True)
+            # The last piece may continue in the next chunk (even a trailing \r,
+            # which could be the first half of \r\n)
+            carry = pieces.pop() if not pieces[-1].endswith(b'\n') else b""
+            offsets.extend(islice(accumulate(map(len, pieces), initial=offsets[-1]), 1, None))
+    if carry:
+        offsets.append(offsets[-1] + len(carry))
+    return offsets
+
+
+@functools.lru_cache(maxsize=128)
+def _count_lines(path: str, mtime_ns: int, size: int) -> int:
+    """Count the lines readlines() would return, scanning the raw bytes in chunks."""
+    count = 0
+    last = b""
+    with open(path, 'rb') as f:
+        while chunk := f.read(1 << 20):
+            count += chunk.count(b'\n') + chunk.count(b'\r') - chunk.count(b'\r\n')
+            if last == b'\r' and chunk[:1] == b'\n':
+                # A \r\n split across two chunks is one line break
+                count -= 1
+            last = chunk[-1:]
+    if last and last not in b'\r\n':
+        # Unterminated last line
+        count += 1
+    return count
+
+
+def _decode_text(data: Any) -> str:
+    """Decode UTF-8 bytes (or any buffer) with text-mode newline translation."""
+    content = str(data, 'utf-8')
+    # Universal newlines; replace() returns the string itself when there is no \r
+    return content.replace('\r\n', '\n').replace('\r', '\n')
+
+
+def _has_other_line_breaks(text: str) -> bool:
+    """Whether str.splitlines() would break text anywhere other than at \n."""
+    return any(char in text for char in _OTHER_LINE_BREAKS)
+
+
+def _count_text_lines(content: str) -> int:
+    """Return len(content.splitlines()) without building the list of lines."""
+    if _has_other_line_breaks(content):
+        return len(content.splitlines())
+    return content.count('\n') + (not content.endswith('\n') and content != "")
+
+
+def _read_line_range(path: str, offsets: array, start_idx: int, end_idx: int) -> List[str]:
+    """Read and decode only lines start_idx..end_idx-1 of a file."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        # One positioned read of exactly the page's bytes
+        data = os.pread(fd, offsets[end_idx] - offsets[start_idx], offsets[start_idx])
+    finally:
+        os.close(fd)
+    # Same newline translation as reading the file in text mode
+    return io.StringIO(data.decode('utf-8'), newline=None).readlines()
+
+
+def _stat(file_path: str) -> Optional[os.stat_result]:
+    """Stat a file in the one syscall that also serves as the existence check.
+
+    Returns:
+        The stat result, or None where os.path.exists would be False
+    """
+    try:
+        return os.stat(file_path)
+    except (OSError, ValueError):
+        return None
+
+
+def _load_file(file_path: str, st: os.stat_result) -> ParsedDoc:
+    """Return the parsed contents of ``file_path``, reusing them while the file is unchanged."""
+    return _load(os.path.abspath(file_path), st.st_mtime_ns, st.st_size)
 
 
 def read_markdown_file(file_path: str, runtime: ToolRuntime[Context]) -> str:
@@ -25,7 +248,8 @@ def read_markdown_file(file_path: str, runtime: ToolRuntime[Context]) -> str:
         The contents of the markdown file as a string
     """
     try:
-        if not os.path.exists(file_path):
+        st = _stat(file_path)
+        if st is None:
             return f"Error: File '{file_path}' does not exist"
             
         if not file_path.lower().endswith('.md'):
@@ -34,16 +258,21 @@ def read_markdown_file(file_path: str, runtime: ToolRuntime[Context]) -> str:
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
             
-        # Add file metadata
-        file_info = f"=== File: {file_path} ===\n"
-        file_info += f"Total lines: {len(content.splitlines())}\n"
-        file_info += f"File size: {len(content)} characters\n\n"
-        
-        return file_info + content
+        return _render_markdown_file(file_path, content)
     except Exception as e:
         return f"Error reading markdown file: {str(e)}"
 
 
+def _render_markdown_file(file_path: str, content: str) -> str:
+    """Prefix a file's contents with its metadata, as read_markdown_file returns it."""
+    return "".join([
+        f"=== File: {file_path} ===\n",
+        f"Total lines: {_count_text_lines(content)}\n",
+        f"File size: {len(content)} characters\n\n",
+        content,
+    ])
+
+
 def read_markdown_lines(file_path: str, start_line: int, runtime: ToolRuntime[Context], end_line: Optional[int] = None) -> str:
     """Read specific lines from a markdown file.
     
@@ -56,35 +285,35 @@ def read_markdown_lines(file_path: str, start_line: int, runtime: ToolRuntime[Co
         The specified lines from the markdown file
     """
     try:
-        if not os.path.exists(file_path):
+        st = _stat(file_path)
+        if st is None:
             return f"Error: File '{file_path}' does not exist"
             
-        with open(file_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-            
-        total_lines = len(lines)
-        
         # Adjust for 1-based indexing
         start_idx = max(0, start_line - 1)
         
-        if end_line is None:
-            end_idx = total_lines
-        else:
-            end_idx = min(total_lines, end_line)
+        # Only the requested range is read and decoded; the line count comes
+        # from the cached line offsets, as for read_markdown_pages.
+        path = os.path.abspath(file_path)
+        offsets = _line_offsets(path, st.st_mtime_ns, st.st_size)
+        total_lines = len(offsets) - 1
             
         if start_idx >= total_lines:
             return f"Error: Start line {start_line} is beyond file length ({total_lines} lines)"
             
-        selected_lines = lines[start_idx:end_idx]
+        end_idx = total_lines if end_line is None else min(max(start_idx, end_line), total_lines)
+        selected_lines = _read_line_range(path, offsets, start_idx, end_idx)
+            
         line_numbers = range(start_line, min(start_line + len(selected_lines), total_lines + 1))
         
-        result = f"=== Lines {line_numbers[0]}-{line_numbers[-1]} from {file_path} ===\n"
-        result += f"Total file lines: {total_lines}\n\n"
+        parts: List[str] = [
+            f"=== Lines {line_numbers[0]}-{line_numbers[-1]} from {file_path} ===\n",
+            f"Total file lines: {total_lines}\n\n",
+        ]
         
-        for i, line in enumerate(selected_lines):
-            result += f"{line_numbers[i]:4d} | {line}"
+        parts.extend(f"{str(n).rjust(4)} | {line}" for n, line in zip(line_numbers, selected_lines))
             
-        return result
+        return "".join(parts)
     except Exception as e:
         return f"Error reading markdown lines: {str(e)}"
 
@@ -101,28 +330,36 @@ def read_markdown_pages(file_path: str, runtime: ToolRuntime[Context], page_num:
         The specified page or information about all pages
     """
     try:
-        if not os.path.exists(file_path):
+        st = _stat(file_path)
+        if st is None:
             return f"Error: File '{file_path}' does not exist"
             
-        with open(file_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-            
-        total_lines = len(lines)
+        # Pages are read straight from their byte range; the file is never
+        # decoded as a whole.
+        path = os.path.abspath(file_path)
+        if page_num is None:
+            # The page listing only needs the line count
+            total_lines = _count_lines(path, st.st_mtime_ns, st.st_size)
+        else:
+            offsets = _line_offsets(path, st.st_mtime_ns, st.st_size)
+            total_lines = len(offsets) - 1
         total_pages = (total_lines + lines_per_page - 1) // lines_per_page
         
         if page_num is None:
             # Return metadata about all pages
-            result = f"=== File: {file_path} ===\n"
-            result += f"Total lines: {total_lines}\n"
-            result += f"Lines per page: {lines_per_page}\n"
-            result += f"Total pages: {total_pages}\n\n"
+            parts: List[str] = [
+                f"=== File: {file_path} ===\n",
+                f"Total lines: {total_lines}\n",
+                f"Lines per page: {lines_per_page}\n",
+                f"Total pages: {total_pages}\n\n",
+            ]
             
             for i in range(1, total_pages + 1):
                 start_line = (i - 1) * lines_per_page + 1
                 end_line = min(i * lines_per_page, total_lines)
-                result += f"Page {i}: Lines {start_line}-{end_line}\n"
+                parts.append(f"Page {i}: Lines {start_line}-{end_line}\n")
                 
-            return result
+            return "".join(parts)
         else:
             # Return specific page
             if page_num < 1 or page_num > total_pages:
@@ -133,15 +370,16 @@ def read_markdown_pages(file_path: str, runtime: ToolRuntime[Context], page_num:
             start_line = start_idx + 1
             end_line = end_idx
             
-            page_lines = lines[start_idx:end_idx]
+            page_lines = _read_line_range(path, offsets, start_idx, end_idx)
             
-            result = f"=== Page {page_num}/{total_pages} from {file_path} ===\n"
-            result += f"Lines {start_line}-{end_line} of {total_lines}\n\n"
+            parts = [
+                f"=== Page {page_num}/{total_pages} from {file_path} ===\n",
+                f"Lines {start_line}-{end_line} of {total_lines}\n\n",
+            ]
             
-            for i, line in enumerate(page_lines):
-                result += f"{start_line + i:4d} | {line}"
+            parts.extend(f"{str(n).rjust(4)} | {line}" for n, line in enumerate(page_lines, start_line))
                 
-            return result
+            return "".join(parts)
     except Exception as e:
         return f"Error reading markdown pages: {str(e)}"
 
@@ -157,65 +395,46 @@ def read_markdown_sections(file_path: str, runtime: ToolRuntime[Context], sectio
         The specified section content or list of all sections
     """
     try:
-        if not os.path.exists(file_path):
+        st = _stat(file_path)
+        if st is None:
             return f"Error: File '{file_path}' does not exist"
             
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
-        lines = content.splitlines()
-        sections = []
-        current_section = None
-        current_content = []
-        
-        # Find all sections
-        for line in lines:
-            header_match = re.match(r'^(#{1,6})\s+(.+)$', line)
-            if header_match:
-                # Save previous section
-                if current_section is not None:
-                    sections.append((current_section, '\n'.join(current_content)))
-                
-                # Start new section
-                level = len(header_match.group(1))
-                name = header_match.group(2).strip()
-                current_section = {'name': name, 'level': level, 'line': lines.index(line) + 1}
-                current_content = [line]
-            else:
-                if current_section is not None:
-                    current_content.append(line)
-                else:
-                    # Content before first header
-                    current_content = [line] if not current_content else current_content + [line]
-        
-        # Save last section
-        if current_section is not None:
-            sections.append((current_section, '\n'.join(current_content)))
+        doc = _load_file(file_path, st)
+        sections = doc.sections
         
         if section_name is None:
             # Return list of all sections
-            result = f"=== Sections in {file_path} ===\n\n"
+            parts: List[str] = [f"=== Sections in {file_path} ===\n\n"]
             
             # Add content before first header if exists
-            if sections and not sections[0][0]['name']:
-                result += f"[Preamble] (Lines 1-{sections[0][0]['line']-1})\n"
+            if sections and not sections[0]['name']:
+                parts.append(f"[Preamble] (Lines 1-{sections[0]['line']-1})\n")
                 
-            for section_info, content in sections:
+            for section_info in sections:
                 if section_info['name']:
                     indent = "  " * (section_info['level'] - 1)
-                    result += f"{indent}- {section_info['name']} (Line {section_info['line']})\n"
+                    parts.append(f"{indent}- {section_info['name']} (Line {section_info['line']})\n")
                     
-            return result
+            return "".join(parts)
         else:
-            # Find and return specific section
-            for section_info, content in sections:
-                if section_info['name'] and section_name.lower() in section_info['name'].lower():
-                    result = f"=== Section: {section_info['name']} ===\n"
-                    result += f"Line: {section_info['line']}, Level: {section_info['level']}\n\n"
-                    result += content
-                    return result
-                    
-            return f"Error: Section '{section_name}' not found in file"
+            # Find and return specific section: an exact (case-insensitive) name
+            # first, otherwise the first section whose name contains it
+            query = section_name.lower()
+            position = doc.section_index.get(query)
+            if position is None:
+                position = next(
+                    (i for i, name in enumerate(doc.section_names_lower) if name and query in name),
+                    None,
+                )
+            if position is None:
+                return f"Error: Section '{section_name}' not found in file"
+                
+            section_info = sections[position]
+            return "".join([
+                f"=== Section: {section_info['name']} ===\n",
+                f"Line: {section_info['line']}, Level: {section_info['level']}\n\n",
+                _section_text(doc, position),
+            ])
     except Exception as e:
         return f"Error reading markdown sections: {str(e)}"
 
@@ -223,6 +442,8 @@ def read_markdown_sections(file_path: str, runtime: ToolRuntime[Context], sectio
 def search_markdown_content(file_path: str, search_term: str, runtime: ToolRuntime[Context], context_lines: int = 3) -> str:
     """Search for specific content in a markdown file with context.
     
+    Matches whose context windows overlap are shown together in one block.
+    
     Args:
         file_path: The path to the markdown file to search
         search_term: The term to search for
@@ -232,49 +453,110 @@ def search_markdown_content(file_path: str, search_term: str, runtime: ToolRunti
         Search results with context
     """
     try:
-        if not os.path.exists(file_path):
+        st = _stat(file_path)
+        if st is None:
             return f"Error: File '{file_path}' does not exist"
             
-        with open(file_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-            
-        matches = []
-        search_term_lower = search_term.lower()
-        
-        for i, line in enumerate(lines):
-            if search_term_lower in line.lower():
-                start_line = max(0, i - context_lines)
-                end_line = min(len(lines), i + context_lines + 1)
-                
-                context_lines_list = lines[start_line:end_line]
-                match_line_in_context = i - start_line
-                
-                context_text = ""
-                for j, ctx_line in enumerate(context_lines_list):
-                    line_num = start_line + j + 1
-                    marker = ">>> " if j == match_line_in_context else "    "
-                    context_text += f"{marker}{line_num:4d} | {ctx_line}"
-                
-                matches.append((i + 1, context_text))
+        doc = _load_file(file_path, st)
+        lines = doc.lines
+        hits = _find_lines(doc, search_term.lower())
         
-        if not matches:
+        if not hits:
             return f"No matches found for '{search_term}' in {file_path}"
             
-        result = f"=== Search Results for '{search_term}' in {file_path} ===\n"
-        result += f"Found {len(matches)} match{'es' if len(matches) != 1 else ''}\n\n"
+        # Merge overlapping context windows, so nearby matches are
+        # shown in one block instead of repeating the lines they share
+        windows: List[Tuple[int, int, List[int]]] = []
+        for i in hits:
+            start_line = max(0, i - context_lines)
+            end_line = min(len(lines), i + context_lines + 1)
+            if windows and start_line < windows[-1][1]:
+                windows[-1] = (windows[-1][0], end_line, windows[-1][2] + [i])
+            else:
+                windows.append((start_line, end_line, [i]))
+                
+        parts: List[str] = [
+            f"=== Search Results for '{search_term}' in {file_path} ===\n",
+            f"Found {len(hits)} match{'es' if len(hits) != 1 else ''}\n\n",
+        ]
         
-        for i, (line_num, context) in enumerate(matches, 1):
-            result += f"Match {i} (Line {line_num}):\n"
-            result += context + "\n"
+        match_num = 1
+        for start_line, end_line, window_hits in windows:
+            if len(window_hits) == 1:
+                parts.append(f"Match {match_num} (Line {window_hits[0] + 1}):\n")
+            else:
+                line_list = ", ".join(str(i + 1) for i in window_hits)
+                parts.append(f"Matches {match_num}-{match_num + len(window_hits) - 1} (Lines {line_list}):\n")
+            match_num += len(window_hits)
+            
+            hit_set = set(window_hits)
+            parts.extend(
+                f"{_MARKERS[line_num in hit_set]}{str(line_num + 1).rjust(4)} | {ctx_line}"
+                for line_num, ctx_line in enumerate(lines[start_line:end_line], start_line)
+            )
+            parts.append("\n")
             
-        return result
+        return "".join(parts)
     except Exception as e:
         return f"Error searching markdown content: {str(e)}"
 
 
+def read_markdown_files_batch(file_paths: List[str], runtime: ToolRuntime[Context]) -> List[str]:
+    """Read several markdown files concurrently.
+    
+    Meant for code that loads many papers up front; like read_markdown_file it is
+    not registered in PAPER_TOOLS, so whole papers never go to the model.
+    
+    Each file is read with read_markdown_file on a thread pool; the blocking read()
+    releases the GIL, so the I/O of the whole batch overlaps instead of adding up.
+    With the io_uring backend enabled (see _uring_backend), the reads are instead
+    submitted to the kernel in batches.
+    
+    Args:
+        file_paths: The paths to the markdown files to read
+        runtime: The tool runtime with agent context
+        
+    Returns:
+        The result of read_markdown_file for each path, in the same order
+    """
+    if not file_paths:
+        return []
+    if _uring_backend.ENABLED:
+        try:
+            return _read_markdown_files_uring(file_paths)
+        except Exception:
+            # Per-file errors, and any failure of the optional backend itself,
+            # are handled by the thread-pool path below
+            pass
+    with ThreadPoolExecutor(max_workers=min(32, len(file_paths))) as executor:
+        return list(executor.map(lambda path: read_markdown_file(path, runtime), file_paths))
+
+
+def _read_markdown_files_uring(file_paths: List[str]) -> List[str]:
+    """read_markdown_files_batch on top of the io_uring backend."""
+    results: List[str] = [""] * len(file_paths)
+    to_read: List[int] = []
+    for i, file_path in enumerate(file_paths):
+        if _stat(file_path) is None:
+            results[i] = f"Error: File '{file_path}' does not exist"
+        elif not file_path.lower().endswith('.md'):
+            results[i] = f"Warning: File '{file_path}' is not a markdown file (.md)"
+        else:
+            to_read.append(i)
+            
+    contents = _uring_backend.read_all([file_paths[i] for i in to_read])
+    for i, data in zip(to_read, contents):
+        try:
+            results[i] = _render_markdown_file(file_paths[i], _decode_text(data))
+        except Exception as e:
+            results[i] = f"Error reading markdown file: {str(e)}"
+    return results
+
+
 # Register all tools
 PAPER_TOOLS: List[Callable[..., Any]] = [
     # read_markdown_file,
+    # read_markdown_files_batch,
     read_markdown_lines,
     read_markdown_pages,
     read_markdown_sections,
@@ -367,6 +649,11 @@ This concludes our test document.
         print(result)
         print()
         
+        print("8. Testing read_markdown_files_batch:")
+        results = read_markdown_files_batch([test_file, test_file], mock_runtime)
+        print(f"Read {len(results)} files, identical: {results[0] == results[1]}")
+        print()
+        
         print("=== All tests completed successfully! ===")
         
     except Exception as e: